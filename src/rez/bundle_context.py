@@ -216,7 +216,7 @@ class _ContextBundler(object):
         those paths map to packages also inside the bundle. If they do, those
         rpath entries are remapped to form "$ORIGIN/{relative-path}".
         """
-        from rez.utils.elf import get_rpaths, patch_rpaths
+        from rez.utils.elf import get_rpaths, patch_rpaths_many
 
         elfs = self._find_files(
             executable=True,
@@ -227,15 +227,10 @@ class _ContextBundler(object):
             self._info("No elfs found, thus no patching performed")
             return
 
-        readelf = which("readelf")
+        # note that readelf isn't needed, rpaths are read directly from file
         patchelf = which("patchelf")
 
-        if not readelf:
-            self._warning(
-                "Could not patch %d files: cannot find 'readelf' utility.",
-                len(elfs)
-            )
-            return
+        to_patch = []  # (elf, rpaths, new_rpaths)
 
         for elf in elfs:
             try:
@@ -311,10 +306,14 @@ class _ContextBundler(object):
                 )
                 continue
 
-            try:
-                patch_rpaths(elf, new_rpaths)
-            except RuntimeError as e:
-                self._warning(str(e))
+            to_patch.append((elf, rpaths, new_rpaths))
+
+        # patch elfs concurrently, there may be very many of them
+        errors = patch_rpaths_many([(x[0], x[2]) for x in to_patch])
+
+        for (elf, rpaths, new_rpaths), error in zip(to_patch, errors):
+            if error:
+                self._warning(str(error))
                 continue
 
             self._info(
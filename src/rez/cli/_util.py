@@ -21,6 +21,8 @@ import signal
 from argparse import _SubParsersAction, ArgumentParser, SUPPRESS, \
     ArgumentError
 
+from rez.backport.lru_cache import lru_cache
+
 
 # Subcommands and their behaviors.
 #
@@ -201,17 +203,38 @@ def _env_var_true(name):
     return (os.getenv(name, "").lower() in ("1", "true", "on", "yes"))
 
 
-def print_items(items, stream=sys.stdout):
+@lru_cache(maxsize=512)
+def get_package_request(txt):
+    """Parse a package request given on the command line.
+
+    Parsed requests are cached, so drivers that run commands repeatedly
+    in-process don't reparse the same request. The returned object is shared
+    and must not be modified.
+
+    Returns:
+        `PackageRequest`: The parsed request.
+    """
+    from rez.utils.formatting import PackageRequest
+    return PackageRequest(txt)
+
+
+def print_items(items, stream=None):
+    stream = stream or sys.stdout
+
     try:
         item_per_line = (not stream.isatty())
     except:
         item_per_line = True
 
+    # build the output in one pass and write it in a single call, rather than
+    # issuing a write per item
+    items = [str(x) for x in items]
+
     if item_per_line:
-        for item in items:
-            print(item)
+        if items:
+            stream.write('\n'.join(items) + '\n')
     else:
-        print(' '.join(map(str, items)))
+        stream.write(' '.join(items) + '\n')
 
 
 def sigbase_handler(signum, frame):
@@ -19,6 +19,7 @@ Create a Rez package for existing software.
 from __future__ import print_function
 
 import argparse
+import sys
 
 
 def setup_parser(parser, completions=False):
@@ -51,27 +52,39 @@ def setup_parser(parser, completions=False):
 
 
 def command(opts, parser, extra_arg_groups=None):
-    from rez.config import config
-    from rez.package_bind import bind_package, find_bind_module, \
-        get_bind_modules, _print_package_list
-    from rez.utils.formatting import PackageRequest, columnise
-
-    if opts.release:
-        install_path = config.release_packages_path
-    elif opts.install_path:
-        install_path = opts.install_path
-    else:
-        install_path = config.local_packages_path
+    def _install_path():
+        # an explicit path doesn't need config at all
+        if opts.install_path and not opts.release:
+            return opts.install_path
+
+        from rez.config import config
+
+        if opts.release:
+            return config.release_packages_path
+        else:
+            return config.local_packages_path
 
     if opts.list:
+        from rez.package_bind import get_bind_modules
+
+        # two columns only, so format directly rather than via columnise
         d = get_bind_modules()
-        rows = [["PACKAGE", "BIND MODULE"],
-                ["-------", "-----------"]]
-        rows += sorted(d.items())
-        print('\n'.join(columnise(rows)))
+        width = max([len("PACKAGE")] + [len(x) for x in d])
+        fmt = "%%-%ds  %%s\n" % width
+
+        sys.stdout.write(fmt % ("PACKAGE", "BIND MODULE"))
+        sys.stdout.write(fmt % ("-------", "-----------"))
+        for name, filepath in sorted(d.items()):
+            sys.stdout.write(fmt % (name, filepath))
         return
 
     if opts.quickstart:
+        from rez.package_bind import bind_package, get_bind_modules, \
+            _print_package_list
+
+        install_path = _install_path()
+        bind_modules = get_bind_modules()
+
         # note: in dependency order, do not change
         names = ["platform",
                  "arch",
@@ -89,7 +102,8 @@ def command(opts, parser, extra_arg_groups=None):
             variants_ = bind_package(name,
                                      path=install_path,
                                      no_deps=True,
-                                     quiet=True)
+                                     quiet=True,
+                                     bind_modules=bind_modules)
             variants.extend(variants_)
 
         if variants:
@@ -106,15 +120,19 @@ def command(opts, parser, extra_arg_groups=None):
     if not opts.PKG:
         parser.error("PKG required.")
 
-    req = PackageRequest(opts.PKG)
+    from rez.cli._util import get_package_request
+
+    req = get_package_request(opts.PKG)
     name = req.name
     version_range = None if req.range.is_any() else req.range
 
     if opts.search:
+        from rez.package_bind import find_bind_module
         find_bind_module(name, verbose=True)
     else:
+        from rez.package_bind import bind_package
         bind_package(name,
-                     path=install_path,
+                     path=_install_path(),
                      version_range=version_range,
                      no_deps=opts.no_deps,
                      bind_args=opts.BIND_ARGS)
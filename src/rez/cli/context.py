@@ -18,35 +18,49 @@ Print information about the current rez context, or a given context file.
 '''
 from __future__ import print_function
 
-# Disable the following:
-# - context tracking
-# - package caching
-#
-# Use of rez-context is't really 'using' the context, so much as inspecting it.
-# Since features such as context tracking are related to context use only, we
-# disable them in this tool.
-#
 import os
 import json
 import sys
 
-os.environ.update({
-    "REZ_CONTEXT_TRACKING_HOST": '',
-    "REZ_WRITE_PACKAGE_CACHE": "False"
-})
+from rez.backport.lru_cache import lru_cache
+
+
+@lru_cache()
+def _get_formats():
+    from rez.shells import get_shell_types
+    return tuple(get_shell_types()) + ('dict', 'table', 'json')
+
+
+@lru_cache()
+def _get_output_styles():
+    from rez.rex import OutputStyle
+    return tuple(e.name for e in OutputStyle)
+
+
+@lru_cache(maxsize=16)
+def _load_context_cached(filepath, realpath, file_key):
+    from rez.resolved_context import ResolvedContext
+    return ResolvedContext.load(filepath)
+
+
+def _load_context(filepath):
+    """Load a context file, reusing a previous load of the same unmodified
+    file within this process.
+    """
+    realpath = os.path.realpath(filepath)
 
-from rez.rex import OutputStyle  # noqa
+    # mtime alone can miss a rewrite within the filesystem's mtime resolution
+    st = os.stat(realpath)
+    file_key = (st.st_dev, st.st_ino, st.st_mtime, st.st_size)
+
+    return _load_context_cached(filepath, realpath, file_key)
 
 
 def setup_parser(parser, completions=False):
     from rez.system import system
-    from rez.shells import get_shell_types
-
-    formats = get_shell_types() + ['dict', 'table']
-    if json is not None:
-        formats.append('json')
 
-    output_styles = [e.name for e in OutputStyle]
+    formats = _get_formats()
+    output_styles = _get_output_styles()
 
     parser.add_argument(
         "--req", "--print-request", dest="print_request",
@@ -121,22 +135,35 @@ def setup_parser(parser, completions=False):
 
 
 def command(opts, parser, extra_arg_groups=None):
+    # Disable the following:
+    # - context tracking
+    # - package caching
+    #
+    # Use of rez-context is't really 'using' the context, so much as inspecting
+    # it. Since features such as context tracking are related to context use
+    # only, we disable them in this tool.
+    #
+    os.environ.update({
+        "REZ_CONTEXT_TRACKING_HOST": '',
+        "REZ_WRITE_PACKAGE_CACHE": "False"
+    })
+
     from rez.cli._util import print_items
     from rez.status import status
-    from rez.utils.formatting import columnise, PackageRequest
-    from rez.resolved_context import ResolvedContext
-    from rez.utils.graph_utils import save_graph, view_graph, prune_graph
-    from pprint import pformat
 
     rxt_file = opts.RXT if opts.RXT else status.context_file
     if not rxt_file:
         print("not in a resolved environment context.", file=sys.stderr)
         sys.exit(1)
 
+    from rez.resolved_context import ResolvedContext
+
     if rxt_file == '-':  # read from stdin
         rc = ResolvedContext.read_from_buffer(sys.stdin, 'STDIN')
-    else:
+    elif opts.fetch:
         rc = ResolvedContext.load(rxt_file)
+    else:
+        rc = _load_context(rxt_file)
 
     def _graph():
         if rc.has_graph:
@@ -161,11 +188,14 @@ def command(opts, parser, extra_arg_groups=None):
         elif opts.tools:
             rc.print_tools()
         elif opts.diff:
-            rc_other = ResolvedContext.load(opts.diff)
+            rc_other = _load_context(opts.diff)
             rc.print_resolve_diff(rc_other, True)
         elif opts.fetch:
-            rc_new = ResolvedContext(rc.requested_packages(),
+            # re-resolve with the same implicits as the original, rather than
+            # re-deriving them from current config
+            rc_new = ResolvedContext(rc.requested_packages(True),
                                      package_paths=rc.package_paths,
+                                     add_implicit_packages=False,
                                      verbosity=opts.verbose)
             rc.print_resolve_diff(rc_new, heading=("current", "updated"))
         elif opts.which:
@@ -179,9 +209,12 @@ def command(opts, parser, extra_arg_groups=None):
             gstr = _graph()
             print(gstr)
         elif opts.graph or opts.dependency_graph or opts.write_graph:
+            from rez.utils.graph_utils import save_graph, view_graph, prune_graph
+
             gstr = _graph()
             if opts.prune_pkg:
-                req = PackageRequest(opts.prune_pkg)
+                from rez.cli._util import get_package_request
+                req = get_package_request(opts.prune_pkg)
                 gstr = prune_graph(gstr, req.name)
             func = view_graph if (opts.graph or opts.dependency_graph) else save_graph
             func(gstr, dest_file=opts.write_graph)
@@ -195,13 +228,17 @@ def command(opts, parser, extra_arg_groups=None):
         env = rc.get_environ(parent_environ=parent_env)
 
         if opts.format == 'table':
-            rows = [x for x in sorted(env.items())]
+            from rez.utils.formatting import columnise
+            rows = sorted(env.items())
             print('\n'.join(columnise(rows)))
         elif opts.format == 'dict':
+            from pprint import pformat
             print(pformat(env))
         else:  # json
             print(json.dumps(env, sort_keys=True, indent=4))
     else:
+        from rez.rex import OutputStyle
+
         code = rc.get_shell_code(shell=opts.format,
                                  parent_environ=parent_env,
                                  style=OutputStyle[opts.style])
@@ -414,6 +414,8 @@ config_schema = Schema({
     "variant_shortlinks_dirname":                   OptionalStr,
     "build_thread_count":                           BuildThreadCount_,
     "resource_caching_maxsize":                     Int,
+    "resolve_caching_threads":                      Int,
+    "release_times_cache_ttl":                      Int,
     "max_package_changelog_chars":                  Int,
     "max_package_changelog_revisions":              Int,
     "memcached_package_file_min_compress_len":      Int,
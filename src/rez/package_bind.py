@@ -52,17 +52,22 @@ def get_bind_modules(verbose=False):
     return bindnames
 
 
-def find_bind_module(name, verbose=False):
+def find_bind_module(name, verbose=False, bind_modules=None):
     """Find the bind module matching the given name.
 
     Args:
         name (str): Name of package to find bind module for.
         verbose (bool): If True, print extra output.
+        bind_modules (dict): Bind modules to search, as returned by
+            `get_bind_modules`. If None, they are searched for.
 
     Returns:
         str: Filepath to bind module .py file, or None if not found.
     """
-    bindnames = get_bind_modules(verbose=verbose)
+    if bind_modules is None:
+        bindnames = get_bind_modules(verbose=verbose)
+    else:
+        bindnames = bind_modules
     bindfile = bindnames.get(name)
 
     if bindfile:
@@ -85,7 +90,7 @@ def find_bind_module(name, verbose=False):
 
 
 def bind_package(name, path=None, version_range=None, no_deps=False,
-                 bind_args=None, quiet=False):
+                 bind_args=None, quiet=False, bind_modules=None):
     """Bind software available on the current system, as a rez package.
 
     Note:
@@ -101,6 +106,9 @@ def bind_package(name, path=None, version_range=None, no_deps=False,
         no_deps (bool): If True, don't bind dependencies.
         bind_args (list of str): Command line options.
         quiet (bool): If True, suppress superfluous output.
+        bind_modules (dict): Available bind modules, as returned by
+            `get_bind_modules`. Pass this when binding several packages, to
+            avoid searching for bind modules each time.
 
     Returns:
         List of `Variant`: The variant(s) that were installed as a result of
@@ -124,7 +132,8 @@ def bind_package(name, path=None, version_range=None, no_deps=False,
                                           path=path,
                                           version_range=version_range,
                                           bind_args=bind_args,
-                                          quiet=quiet)
+                                          quiet=quiet,
+                                          bind_modules=bind_modules)
             except exc_type as e:
                 print_error("Could not bind '%s': %s: %s"
                             % (name_, e.__class__.__name__, str(e)))
@@ -156,8 +165,9 @@ def bind_package(name, path=None, version_range=None, no_deps=False,
 
 
 def _bind_package(name, path=None, version_range=None, bind_args=None,
-                  quiet=False):
-    bindfile = find_bind_module(name, verbose=(not quiet))
+                  quiet=False, bind_modules=None):
+    bindfile = find_bind_module(name, verbose=(not quiet),
+                                bind_modules=bind_modules)
     if not bindfile:
         raise RezBindError("Bind module not found for '%s'" % name)
 
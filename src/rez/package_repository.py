@@ -110,6 +110,13 @@ class PackageRepository(object):
     def clear_caches(self):
         """Clear any cached resources in the pool."""
         self.pool.clear_caches()
+        cached_property.uncache(self, "_recent_release_times")
+
+    @cached_property
+    def _recent_release_times(self):
+        # {family name: (release time, time checked)}, see
+        # `get_last_release_times`
+        return {}
 
     @cached_property
     def uid(self):
@@ -399,6 +406,23 @@ class PackageRepository(object):
         """
         return None
 
+    def get_variant_state_handles(self, variant_resources):
+        """Get the state handles of several variants.
+
+        This is equivalent to calling `get_variant_state_handle` on each
+        variant. Override it if your repository type can retrieve the states of
+        many variants more efficiently in one go (for example, with a single
+        query).
+
+        Args:
+            variant_resources (list of `VariantResource`): Variants, all from
+                this repository.
+
+        Returns:
+            list: State handles, in the same order as `variant_resources`.
+        """
+        return [self.get_variant_state_handle(x) for x in variant_resources]
+
     def get_last_release_time(self, package_family_resource):
         """Get the last time a package was added to the given family.
 
@@ -413,6 +437,45 @@ class PackageRepository(object):
         """
         return 0
 
+    def get_last_release_times(self, package_names, max_age=0):
+        """Get the last release times of several package families.
+
+        Release times checked within the last `max_age` seconds are reused,
+        rather than checked again. These are forgotten by `clear_caches`.
+
+        Args:
+            package_names (list of str): Package family names.
+            max_age (int): Age in seconds of reusable release times. Zero
+                means always check.
+
+        Returns:
+            dict: Release time (see `get_last_release_time`) keyed by family
+            name. Families not present in this repository are omitted.
+        """
+        release_times = {}
+        recent_times = self._recent_release_times
+        now = time.time()
+
+        for name in package_names:
+            entry = recent_times.get(name) if max_age else None
+
+            if entry and (now - entry[1]) < max_age:
+                time_ = entry[0]
+            else:
+                family_resource = self.get_package_family(name)
+                if family_resource:
+                    time_ = self.get_last_release_time(family_resource)
+                else:
+                    time_ = None
+
+                if max_age:
+                    recent_times[name] = (time_, now)
+
+            if time_ is not None:
+                release_times[name] = time_
+
+        return release_times
+
     def make_resource_handle(self, resource_key, **variables):
         """Create a `ResourceHandle`
 
@@ -21,6 +21,8 @@ from rez.package_serialise import dump_package_data
 from rez.utils import reraise
 from rez.utils.sourcecode import SourceCode
 from rez.utils.data_utils import cached_property
+from rez.utils.execution import thread_map
+from rez.utils.memcached import pool_memcached_connections
 from rez.utils.formatting import StringFormatMixin, StringFormatType
 from rez.utils.schema import schema_keys
 from rez.utils.resources import ResourceHandle, ResourceWrapper
@@ -830,15 +832,57 @@ def get_last_release_time(name, paths=None):
         int: Epoch time of last package release, or zero if this cannot be
         determined.
     """
-    entries = _get_families(name, paths)
-    max_time = 0
+    return get_last_release_times([name], paths=paths)[name]
 
-    for repo, family_resource in entries:
-        time_ = repo.get_last_release_time(family_resource)
-        if time_ == 0:
-            return 0
-        max_time = max(max_time, time_)
-    return max_time
+
+def get_last_release_times(names, paths=None):
+    """Returns the most recent release time of each of the given packages.
+
+    This gives the same results as calling `get_last_release_time` for each
+    name, but the package repositories are only looked up once. Release times
+    checked within the last `release_times_cache_ttl` seconds are reused.
+
+    Args:
+        names (list of str): Package family names.
+        paths (list of str): paths to search for packages, defaults to
+            `config.packages_path`.
+
+    Returns:
+        dict: Epoch time of last package release (or zero if this cannot be
+        determined), keyed by package family name.
+    """
+    repos = [
+        package_repository_manager.get_repository(path)
+        for path in (paths or config.packages_path)
+    ]
+
+    ttl = config.release_times_cache_ttl
+
+    # workers run in their own threads, so need their own connection pools
+    @pool_memcached_connections
+    def _get_repo_release_times(repo):
+        return repo.get_last_release_times(names, max_age=ttl)
+
+    repo_release_times = thread_map(_get_repo_release_times, repos,
+                                    config.resolve_caching_threads)
+    release_times = {}
+
+    for name in names:
+        max_time = 0
+
+        for times in repo_release_times:
+            time_ = times.get(name)
+            if time_ is None:
+                continue
+
+            if time_ == 0:
+                max_time = 0
+                break
+            max_time = max(max_time, time_)
+
+        release_times[name] = max_time
+
+    return release_times
 
 
 def get_completions(prefix, paths=None, family_only=False):
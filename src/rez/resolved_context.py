@@ -640,14 +640,15 @@ class ResolvedContext(object):
                 self.graph_ = read_graph_from_string(self.graph_string)
             return self.graph_
 
-        if self.graph_string:
-            if self.graph_string.startswith('{'):  # compact format
-                self.graph_ = read_graph_from_string(self.graph_string)
-            else:
-                # already in dot format. Note that this will only happen in
-                # old rez contexts where the graph is not stored in the newer
-                # compact format.
-                return self.graph_string
+        if self.graph_string and not self.graph_string.startswith('{'):
+            # already in dot format. Note that this will only happen in
+            # old rez contexts where the graph is not stored in the newer
+            # compact format.
+            return self.graph_string
+
+        if self.graph_ is None:
+            # compact format, not yet read
+            self.graph_ = read_graph_from_string(self.graph_string)
 
         return write_dot(self.graph_)
 
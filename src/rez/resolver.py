@@ -15,10 +15,12 @@
 
 from rez.solver import Solver, SolverStatus
 from rez.package_repository import package_repository_manager
-from rez.packages import get_variant, get_last_release_time
+from rez.packages import get_variant, get_last_release_times
 from rez.package_filter import PackageFilterList, TimestampRule
 from rez.utils.memcached import memcached_client, pool_memcached_connections
+from rez.utils.resources import ResourceHandle
 from rez.utils.logging_ import log_duration
+from rez.utils.execution import thread_map
 from rez.config import config
 from rez.vendor.enum import Enum
 from rez.vendor.version.requirement import Requirement
@@ -112,27 +114,47 @@ class Resolver(object):
         self.failure_description = None
         self.graph_ = None
         self.from_cache = False
+
+        # the graph is only built from the solver when it's first needed
+        self._graph_solver = None
         self.memcached_servers = config.memcached_uri if config.resolve_caching else None
 
+        # settings read once, rather than on every cache lookup/store
+        self._prune_failed_graph = config.prune_failed_graph
+        self._debug_memcache = config.debug_memcache
+
         self.solve_time = 0.0  # time spent solving
         self.load_time = 0.0   # time spent loading package resources
 
         self._print = config.debug_printer("resolve_memcache")
 
+        # variant states and package release times fetched during a solve. These
+        # are shared by cache lookup and storage, and are reset on each solve
+        self._variant_states = {}
+        self._last_release_times = {}
+
+        # parts of the memcache key that don't depend on the timestamp
+        self._memcache_key_base = None
+
     @pool_memcached_connections
     def solve(self):
         """Perform the solve.
         """
+        self._variant_states = {}
+        self._last_release_times = {}
+
         with log_duration(self._print, "memcache get (resolve) took %s"):
             solver_dict = self._get_cached_solve()
 
         if solver_dict:
             self.from_cache = True
+            self._graph_solver = None
             self._set_result(solver_dict)
         else:
             self.from_cache = False
             solver = self._solve()
             solver_dict = self._solver_to_dict(solver)
+            self._graph_solver = solver
             self._set_result(solver_dict)
 
             with log_duration(self._print, "memcache set (resolve) took %s"):
@@ -176,6 +198,10 @@ class Resolver(object):
         Returns:
             A pygraph.digraph object, or None if the solve has not completed.
         """
+        if self.graph_ is None and self._graph_solver is not None:
+            self.graph_ = self._graph_solver.get_graph()
+            self._graph_solver = None
+
         return self.graph_
 
     def _get_variant(self, variant_handle):
@@ -221,13 +247,15 @@ class Resolver(object):
         reused if the timestamp matches exactly (but this might happen a lot -
         consider a workflow where a work area is tied down to a particular
         timestamp in order to 'lock' it from any further software releases).
+
+        Note that when there is a resolve timestamp, both entries are fetched
+        up front in a single request, and entries to delete are discarded
+        together once the lookup is done.
         """
         if not (self.caching and self.memcached_servers):
             return None
 
-        # these caches avoids some potentially repeated file stats
-        variant_states = {}
-        last_release_times = {}
+        stale_keys = []
 
         def _hit(data):
             solver_dict, _, _ = data
@@ -238,51 +266,70 @@ class Resolver(object):
             return None
 
         def _delete_cache_entry(key):
-            with self._memcached_client() as client:
-                client.delete(key)
+            stale_keys.append(key)
             self._print("Discarded entry: %r", key)
 
-        def _retrieve(timestamped):
-            key = self._memcache_key(timestamped=timestamped)
-            self._print("Retrieving memcache key: %r", key)
+        def _retrieve():
+            timestampeds = [False, True] if self.timestamp else [False]
+            keys = [self._memcache_key(timestamped=x) for x in timestampeds]
+
+            for key in keys:
+                self._print("Retrieving memcache key: %r", key)
+
             with self._memcached_client() as client:
-                data = client.get(key)
-            return key, data
+                entries = client.get_multi(keys)
+
+            return dict(
+                (timestamped, (key, entries.get(key)))
+                for timestamped, key in zip(timestampeds, keys)
+            )
 
         def _packages_changed(key, data):
             solver_dict, _, variant_states_dict = data
-            for variant_handle in solver_dict.get("variant_handles", []):
-                variant = self._get_variant(variant_handle)
-                old_state = variant_states_dict.get(variant.name)
-
-                new_state = variant_states.get(variant)
-                if new_state is None:
-                    try:
-                        repo = variant.resource._repository
-                        new_state = repo.get_variant_state_handle(variant.resource)
-                    except (IOError, OSError) as e:
-                        # if, ie a package file was deleted on disk, then
-                        # an IOError or OSError will be raised when we try to
-                        # read from it - assume that the packages have changed!
-                        self._print("Error loading %r (assuming cached state "
-                                    "changed): %s", variant.qualified_name,
-                                    e)
-                        return True
-                    variant_states[variant] = new_state
 
+            # variant resources are enough to get states, there's no need to
+            # construct `Variant` objects
+            handles = [
+                ResourceHandle.from_dict(x)
+                for x in solver_dict.get("variant_handles", [])
+            ]
+            resources = [
+                package_repository_manager.get_resource_from_handle(x)
+                for x in handles
+            ]
+
+            try:
+                new_states = self._get_variant_states(resources)
+            except (IOError, OSError) as e:
+                # if, ie a package file was deleted on disk, then
+                # an IOError or OSError will be raised when we try to
+                # read from it - assume that the packages have changed!
+                self._print("Error loading variant states (assuming cached "
+                            "state changed): %s", e)
+                return True
+
+            for handle, new_state in zip(handles, new_states):
+                old_state = variant_states_dict.get(handle.get("name"))
                 if old_state != new_state:
-                    self._print("%r has been modified", variant.qualified_name)
+                    if self._print:
+                        variant = self._get_variant(handle)
+                        self._print("%r has been modified",
+                                    variant.qualified_name)
                     return True
             return False
 
         def _releases_since_solve(key, data):
             _, release_times_dict, _ = data
-            for package_name, release_time in release_times_dict.items():
-                time_ = last_release_times.get(package_name)
-                if time_ is None:
-                    time_ = get_last_release_time(package_name, self.package_paths)
-                    last_release_times[package_name] = time_
+            last_release_times = self._get_last_release_times(
+                list(release_times_dict.keys()))
 
+            if last_release_times == release_times_dict:
+                return False
+            if not self._print:
+                return True
+
+            for package_name, release_time in release_times_dict.items():
+                time_ = last_release_times[package_name]
                 if time_ != release_time:
                     self._print(
                         "A newer version of %r (%d) has been released since the "
@@ -293,6 +340,12 @@ class Resolver(object):
 
         def _timestamp_is_earlier(key, data):
             _, release_times_dict, _ = data
+            if not release_times_dict \
+                    or self.timestamp >= max(release_times_dict.values()):
+                return False
+            if not self._print:
+                return True
+
             for package_name, release_time in release_times_dict.items():
                 if self.timestamp < release_time:
                     self._print("Resolve timestamp (%d) is earlier than %r in "
@@ -301,36 +354,44 @@ class Resolver(object):
                     return True
             return False
 
-        key, data = _retrieve(False)
+        def _lookup(entries):
+            key, data = entries[False]
 
-        if self.timestamp:
-            if data:
+            if self.timestamp:
+                if data:
+                    if _packages_changed(key, data) or _releases_since_solve(key, data):
+                        _delete_cache_entry(key)
+                    elif not _timestamp_is_earlier(key, data):
+                        return _hit(data)
+
+                key, data = entries[True]
+                if not data:
+                    return _miss()
+                if _packages_changed(key, data):
+                    _delete_cache_entry(key)
+                    return _miss()
+                else:
+                    return _hit(data)
+            else:
+                if not data:
+                    return _miss()
                 if _packages_changed(key, data) or _releases_since_solve(key, data):
                     _delete_cache_entry(key)
-                elif not _timestamp_is_earlier(key, data):
+                    return _miss()
+                else:
                     return _hit(data)
 
-            key, data = _retrieve(True)
-            if not data:
-                return _miss()
-            if _packages_changed(key, data):
-                _delete_cache_entry(key)
-                return _miss()
-            else:
-                return _hit(data)
-        else:
-            if not data:
-                return _miss()
-            if _packages_changed(key, data) or _releases_since_solve(key, data):
-                _delete_cache_entry(key)
-                return _miss()
-            else:
-                return _hit(data)
+        try:
+            return _lookup(_retrieve())
+        finally:
+            if stale_keys:
+                with self._memcached_client() as client:
+                    client.delete_multi(stale_keys)
 
     @contextmanager
     def _memcached_client(self):
         with memcached_client(self.memcached_servers,
-                              debug=config.debug_memcache) as client:
+                              debug=self._debug_memcache) as client:
             yield client
 
     def _set_cached_solve(self, solver_dict):
@@ -353,11 +414,11 @@ class Resolver(object):
 
         # most recent release times get stored with solve result in the cache
         releases_since_solve = False
-        release_times_dict = {}
-        variant_states_dict = {}
+        release_times_dict = self._get_last_release_times(
+            [x.name for x in self.resolved_packages_])
 
         for variant in self.resolved_packages_:
-            time_ = get_last_release_time(variant.name, self.package_paths)
+            time_ = release_times_dict[variant.name]
 
             # don't cache if a release time isn't known
             if time_ == 0:
@@ -369,38 +430,72 @@ class Resolver(object):
             if self.timestamp and self.timestamp < time_:
                 releases_since_solve = True
 
-            release_times_dict[variant.name] = time_
-            repo = variant.resource._repository
-            variant_states_dict[variant.name] = \
-                repo.get_variant_state_handle(variant.resource)
+        variant_states = self._get_variant_states(
+            [x.resource for x in self.resolved_packages_])
+        variant_states_dict = dict(
+            (variant.name, state)
+            for variant, state in zip(self.resolved_packages_, variant_states)
+        )
 
         timestamped = (self.timestamp and releases_since_solve)
         key = self._memcache_key(timestamped=timestamped)
+        solver_dict = dict(solver_dict, graph=self.graph)
         data = (solver_dict, release_times_dict, variant_states_dict)
         with self._memcached_client() as client:
-            client.set(key, data)
+            client.set(key, data,
+                       min_compress_len=config.memcached_resolve_min_compress_len)
         self._print("Sent memcache key: %r", key)
 
+    def _get_variant_states(self, variant_resources):
+        """Get variant state handles, reusing those already fetched during
+        this solve.
+        """
+        new_resources = [
+            x for x in variant_resources
+            if x not in self._variant_states
+        ]
+        if new_resources:
+            new_states = _get_variant_states(new_resources)
+            self._variant_states.update(zip(new_resources, new_states))
+
+        return [self._variant_states[x] for x in variant_resources]
+
+    def _get_last_release_times(self, names):
+        """Get package release times, reusing those already fetched during
+        this solve.
+        """
+        new_names = [x for x in names if x not in self._last_release_times]
+        if new_names:
+            self._last_release_times.update(
+                get_last_release_times(new_names, self.package_paths))
+
+        return dict((x, self._last_release_times[x]) for x in names)
+
     def _memcache_key(self, timestamped=False):
         """Makes a key suitable as a memcache entry."""
-        request = tuple(map(str, self.package_requests))
-        repo_ids = []
-        for path in self.package_paths:
-            repo = package_repository_manager.get_repository(path)
-            repo_ids.append(repo.uid)
-
-        t = ["resolve",
-             request,
-             tuple(repo_ids),
-             self.package_filter_hash,
-             self.package_orderers_hash,
-             self.building,
-             config.prune_failed_graph]
+        if self._memcache_key_base is None:
+            request = tuple(map(str, self.package_requests))
+            repo_ids = []
+            for path in self.package_paths:
+                repo = package_repository_manager.get_repository(path)
+                repo_ids.append(repo.uid)
+
+            self._memcache_key_base = (
+                "resolve",
+                request,
+                tuple(repo_ids),
+                self.package_filter_hash,
+                self.package_orderers_hash,
+                self.building,
+                self._prune_failed_graph
+            )
+
+        t = self._memcache_key_base
 
         if timestamped and self.timestamp:
-            t.append(self.timestamp)
+            t += (self.timestamp,)
 
-        return str(tuple(t))
+        return str(t)
 
     def _solve(self):
         solver = Solver(package_requests=self.package_requests,
@@ -412,7 +507,7 @@ class Resolver(object):
                         package_load_callback=self.package_load_callback,
                         building=self.building,
                         verbosity=self.verbosity,
-                        prune_unfailed=config.prune_failed_graph,
+                        prune_unfailed=self._prune_failed_graph,
                         buf=self.buf,
                         suppress_passive=self.suppress_passive,
                         print_stats=self.print_stats)
@@ -444,7 +539,7 @@ class Resolver(object):
 
     @classmethod
     def _solver_to_dict(cls, solver):
-        graph_ = solver.get_graph()
+        """Note that the graph is not included, see `graph`."""
         solve_time = solver.solve_time
         load_time = solver.load_time
         failure_description = None
@@ -473,10 +568,44 @@ class Resolver(object):
 
         return dict(
             status=status_,
-            graph=graph_,
             solve_time=solve_time,
             load_time=load_time,
             failure_description=failure_description,
             variant_handles=variant_handles,
             ephemerals=ephemerals
         )
+
+
+def _get_variant_states(variant_resources):
+    """Get the state handles of the given variant resources.
+
+    States are fetched with one `get_variant_state_handles` call per package
+    repository, rather than one call per variant. Repositories are queried
+    concurrently if `resolve_caching_threads` is greater than one.
+
+    Returns:
+        list: State handles, in the same order as `variant_resources`.
+    """
+    states = [None] * len(variant_resources)
+    repo_indexes = {}
+
+    for i, resource in enumerate(variant_resources):
+        repo = resource._repository
+        repo_indexes.setdefault(repo.uid, (repo, []))[1].append(i)
+
+    # workers run in their own threads, so need their own connection pools
+    @pool_memcached_connections
+    def _get_repo_states(entry):
+        repo, indexes = entry
+        resources = [variant_resources[i] for i in indexes]
+        return repo.get_variant_state_handles(resources)
+
+    entries = list(repo_indexes.values())
+    repo_states = thread_map(_get_repo_states, entries,
+                             config.resolve_caching_threads)
+
+    for (_, indexes), states_ in zip(entries, repo_states):
+        for i, state in zip(indexes, states_):
+            states[i] = state
+
+    return states
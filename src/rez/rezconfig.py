@@ -156,6 +156,20 @@ bind_module_path = []
 # would change the result of an existing resolve.
 resolve_caching = True
 
+# Number of threads used to query package repositories when a cached resolve is
+# validated or stored (that is, for package release times and variant states).
+# Repositories are queried concurrently, which can help when several slow
+# repositories (such as network filesystems) are in the packages path. A value
+# of 1 queries repositories one after another.
+resolve_caching_threads = 1
+
+# Number of seconds for which package release times (as used to validate cached
+# resolves) are reused within a process, rather than checked again. This saves
+# repeated filesystem stats when many resolves are done in one process, such as
+# in a suite or test run. However, a package released within this window may
+# not invalidate a cached resolve straight away. Zero disables reuse.
+release_times_cache_ttl = 0
+
 # Cache package file reads to memcached, if enabled. Updated package files will
 # still be read correctly (ie, the cache invalidates when the filesystem
 # changes).
@@ -23,12 +23,16 @@ from rez.bundle_context import bundle_context
 from rez.bind import hello_world
 from rez.utils.platform_ import platform_
 from rez.utils.filesystem import is_subdirectory
+from rez.vendor.six import six
+import rez.cli.context
+import argparse
 import unittest
 import subprocess
 import platform
 import shutil
 import os.path
 import os
+import sys
 
 
 class TestContext(TestBase, TempdirMixin):
@@ -119,6 +123,63 @@ class TestContext(TestBase, TempdirMixin):
         env = r2.get_environ()
         self.assertEqual(env.get("OH_HAI_WORLD"), "hello")
 
+    def test_load_context_cached(self):
+        """Test that rez-context reuses loads of an unmodified context file."""
+        file = os.path.join(self.root, "cached.rxt")
+        ResolvedContext(["hello_world"]).save(file)
+
+        r = rez.cli.context._load_context(file)
+        self.assertIs(rez.cli.context._load_context(file), r)
+
+        # rewritten file is reloaded
+        os.remove(file)
+        ResolvedContext([]).save(file)
+
+        r2 = rez.cli.context._load_context(file)
+        self.assertIsNot(r2, r)
+        self.assertEqual(r2.resolved_packages, [])
+        self.assertIs(rez.cli.context._load_context(file), r2)
+
+    def test_load_context_cache_bypass(self):
+        """Test that rez-context --fetch and stdin don't use cached loads."""
+        file = os.path.join(self.root, "bypass.rxt")
+        ResolvedContext(["hello_world"]).save(file)
+
+        parser = argparse.ArgumentParser()
+        parser.add_argument("-v", "--verbose", action="count", default=0)
+        rez.cli.context.setup_parser(parser)
+
+        load_context = rez.cli.context._load_context
+        loads = []
+
+        def _load_context(filepath):
+            loads.append(filepath)
+            return load_context(filepath)
+
+        def _command(*args):
+            opts = parser.parse_args(list(args))
+            with restore_os_environ():
+                rez.cli.context.command(opts, parser)
+
+        stdin, stdout = sys.stdin, sys.stdout
+        rez.cli.context._load_context = _load_context
+        try:
+            sys.stdout = six.StringIO()
+
+            _command("--res", file)
+            self.assertEqual(loads, [file])
+
+            _command("--fetch", file)
+            self.assertEqual(loads, [file])
+
+            with open(file) as f:
+                sys.stdin = six.StringIO(f.read())
+            _command("--res", "-")
+            self.assertEqual(loads, [file])
+        finally:
+            rez.cli.context._load_context = load_context
+            sys.stdin, sys.stdout = stdin, stdout
+
     def test_retarget(self):
         """Test that a retargeted context behaves identically."""
 
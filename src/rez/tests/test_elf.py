@@ -0,0 +1,172 @@
+# Copyright Contributors to the Rez project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+unit tests for 'utils.elf' module
+"""
+import os
+import shutil
+import sys
+import unittest
+
+from rez.tests.util import TestBase, TempdirMixin
+from rez.utils import elf
+from rez.utils.which import which
+
+
+class TestElf(TestBase, TempdirMixin):
+    @classmethod
+    def setUpClass(cls):
+        TempdirMixin.setUpClass()
+        cls.settings = dict()
+
+    @classmethod
+    def tearDownClass(cls):
+        TempdirMixin.tearDownClass()
+
+    def _write_file(self, name, data):
+        filepath = os.path.join(self.root, name)
+        with open(filepath, "wb") as f:
+            f.write(data)
+        return filepath
+
+    def _readelf_rpaths(self, filepath):
+        out = elf._run("readelf", "-d", filepath)
+        m = elf._rpath_regex.search(out)
+        return m.group(1).split(':') if m else []
+
+    def test_matches_readelf(self):
+        """Test that rpaths read in-process match those read by readelf."""
+        filepath = os.path.realpath(sys.executable)
+
+        with open(filepath, "rb") as f:
+            if f.read(4) != b"\x7fELF":
+                self.skipTest("%s is not an elf" % filepath)
+        if not which("readelf"):
+            self.skipTest("readelf is not available")
+
+        rpaths = elf._read_rpaths(filepath)
+        self.assertIsNotNone(rpaths)
+        self.assertEqual(rpaths, self._readelf_rpaths(filepath))
+        self.assertEqual(elf.get_rpaths(filepath), rpaths)
+
+    def test_not_elf(self):
+        """Test that a non-elf file is reported as such."""
+        filepath = self._write_file("script.so", b"#!/bin/sh\necho hello\n")
+
+        with self.assertRaises(RuntimeError) as cm:
+            elf.get_rpaths(filepath)
+        self.assertIn("Not an ELF file", str(cm.exception))
+
+        filepath = self._write_file("empty.so", b"")
+        self.assertRaises(RuntimeError, elf.get_rpaths, filepath)
+
+    def test_truncated_header(self):
+        """Test elfs that are truncated within their headers."""
+
+        # truncated within e_ident
+        for i in (4, 5, 15):
+            filepath = self._write_file("short%d.so" % i,
+                                        (b"\x7fELF\x02\x01\x01" + b"\0" * 9)[:i])
+
+            with self.assertRaises(RuntimeError) as cm:
+                elf.get_rpaths(filepath)
+            self.assertIn("Failed to read file header", str(cm.exception))
+
+        # truncated after e_ident, left for readelf to report
+        filepath = self._write_file("short20.so",
+                                    b"\x7fELF\x02\x01\x01" + b"\0" * 13)
+        self.assertIsNone(elf._read_rpaths(filepath))
+
+    def _copy_elf(self, name):
+        filepath = os.path.realpath(sys.executable)
+        with open(filepath, "rb") as f:
+            if f.read(4) != b"\x7fELF":
+                self.skipTest("%s is not an elf" % filepath)
+
+        dest_filepath = os.path.join(self.root, name)
+        shutil.copy(filepath, dest_filepath)
+        return dest_filepath
+
+    def test_cache(self):
+        """Test that cached rpaths are reused until the file changes."""
+        filepath = self._copy_elf("cached.so")
+        rpaths = elf.get_rpaths(filepath)
+
+        read_rpaths = elf._read_rpaths
+        reads = []
+
+        def _read_rpaths(path):
+            reads.append(path)
+            return read_rpaths(path)
+
+        elf._read_rpaths = _read_rpaths
+        try:
+            # unchanged file, rpaths are cached
+            self.assertEqual(elf.get_rpaths(filepath), rpaths)
+            self.assertEqual(reads, [])
+
+            # replaced file (different inode and size), rpaths are reread
+            new_filepath = self._write_file("new.so", b"\x7fELF\x02\x01\x01")
+            os.rename(new_filepath, filepath)
+
+            with self.assertRaises(RuntimeError) as cm:
+                elf.get_rpaths(filepath)
+            self.assertIn("Failed to read file header", str(cm.exception))
+            self.assertEqual(reads, [filepath])
+        finally:
+            elf._read_rpaths = read_rpaths
+
+    def test_cache_size(self):
+        """Test that the number of cached rpaths is limited."""
+        filepaths = [self._copy_elf("limit%d.so" % i) for i in range(3)]
+
+        max_size = elf._rpaths_cache_max_size
+        elf._rpaths_cache_max_size = 2
+        try:
+            for filepath in filepaths:
+                elf.get_rpaths(filepath)
+            self.assertLessEqual(len(elf._rpaths_cache), 2)
+            self.assertIn(elf._file_cache_key(filepaths[-1]), elf._rpaths_cache)
+        finally:
+            elf._rpaths_cache_max_size = max_size
+
+    def test_patch_clears_cache(self):
+        """Test that patching an elf drops its cached rpaths."""
+        filepath = self._copy_elf("patched.so")
+        rpaths = elf.get_rpaths(filepath)
+        key = elf._file_cache_key(filepath)
+        self.assertIn(key, elf._rpaths_cache)
+
+        run = elf._run
+        commands = []
+
+        def _run(*nargs, **kwargs):
+            commands.append(nargs)
+            return ''
+
+        elf._run = _run
+        try:
+            elf.patch_rpaths(filepath, rpaths + ["/new/rpath"])
+        finally:
+            elf._run = run
+
+        self.assertEqual(len(commands), 1)
+        self.assertEqual(commands[0][:2], ("patchelf", "--set-rpath"))
+        self.assertNotIn(key, elf._rpaths_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,8 @@ test package iteration, serialization etc
 """
 from rez.packages import iter_package_families, iter_packages, get_package, \
     create_package, get_developer_package, get_variant_from_uri, \
-    get_package_from_uri, get_package_from_repository
+    get_package_from_uri, get_package_from_repository, \
+    get_last_release_time, get_last_release_times
 from rez.package_py_utils import expand_requirement
 from rez.package_resources import package_release_keys
 from rez.package_move import move_package
@@ -593,5 +594,140 @@ class TestMemoryPackages(TestBase):
         self.assertEqual(parent_package.description, desc)
 
 
+class TestReleaseTimes(TestBase, TempdirMixin):
+    @classmethod
+    def setUpClass(cls):
+        TempdirMixin.setUpClass()
+
+        # {repo: {family: release time}}
+        cls.release_times = {
+            "repo_a": {"foo": 1000, "bah": 1500},
+            "repo_b": {"foo": 2000, "eek": 500}
+        }
+
+        for repo_name, families in cls.release_times.items():
+            for name, time_ in families.items():
+                pkg_path = os.path.join(cls.root, repo_name, name, "1.0")
+                os.makedirs(pkg_path)
+
+                with open(os.path.join(pkg_path, "package.py"), 'w') as f:
+                    f.write("name = '%s'\nversion = '1.0'\n" % name)
+
+                family_path = os.path.dirname(pkg_path)
+                os.utime(family_path, (time_, time_))
+
+        cls.repo_paths = [
+            os.path.join(cls.root, "repo_a"),
+            os.path.join(cls.root, "repo_b")
+        ]
+
+        cls.settings = dict(packages_path=cls.repo_paths)
+
+    @classmethod
+    def tearDownClass(cls):
+        TempdirMixin.tearDownClass()
+
+    def test_release_times(self):
+        """Test release times of families across several repositories."""
+        names = ["foo", "bah", "eek", "missing"]
+        release_times = get_last_release_times(names, self.repo_paths)
+
+        self.assertEqual(release_times, {
+            "foo": 2000,  # latest of both repos
+            "bah": 1500,  # missing from repo_b
+            "eek": 500,  # missing from repo_a
+            "missing": 0
+        })
+
+        # packages_path is used by default
+        self.assertEqual(get_last_release_times(names), release_times)
+
+        # same as getting each family's release time separately
+        for name in names:
+            self.assertEqual(get_last_release_time(name, self.repo_paths),
+                             release_times[name])
+
+    def test_unknown_release_time(self):
+        """Test that an unknown release time in any repository gives zero."""
+        path = "memory@release_times_test"
+        repo = package_repository_manager.get_repository(path)
+        repo.data = {"foo": {"1.0": {"name": "foo", "version": "1.0"}}}
+
+        release_times = get_last_release_times(
+            ["foo", "bah"], self.repo_paths + [path])
+
+        self.assertEqual(release_times, {"foo": 0, "bah": 1500})
+
+    def test_release_times_cache_ttl(self):
+        """Test reuse of recently checked release times."""
+        self.update_settings({"release_times_cache_ttl": 60})
+
+        path = os.path.join(self.root, "repo_ttl")
+        family_path = os.path.join(path, "foo")
+        os.makedirs(os.path.join(family_path, "1.0"))
+        os.utime(family_path, (1000, 1000))
+
+        repo = package_repository_manager.get_repository(path)
+        checked = []
+
+        def _get_last_release_time(family_resource):
+            checked.append(family_resource.name)
+            return type(repo).get_last_release_time(repo, family_resource)
+
+        repo.get_last_release_time = _get_last_release_time
+
+        self.assertEqual(get_last_release_times(["foo"], [path]), {"foo": 1000})
+        self.assertEqual(checked, ["foo"])
+
+        # the release is not checked again within the ttl
+        os.utime(family_path, (2000, 2000))
+        self.assertEqual(get_last_release_times(["foo"], [path]), {"foo": 1000})
+        self.assertEqual(checked, ["foo"])
+
+        # clearing caches forces a recheck
+        repo.clear_caches()
+        self.assertEqual(get_last_release_times(["foo"], [path]), {"foo": 2000})
+        self.assertEqual(checked, ["foo", "foo"])
+
+    def test_variant_state_handles(self):
+        """Test that variant states fetched together match those fetched
+        separately."""
+        repo = package_repository_manager.get_repository(self.repo_paths[0])
+        variants = [
+            variant.resource
+            for package in iter_packages("foo", paths=self.repo_paths)
+            for variant in package.iter_variants()
+        ]
+        variants = [x for x in variants if x._repository is repo]
+        self.assertTrue(variants)
+
+        self.assertEqual(
+            repo.get_variant_state_handles(variants),
+            [repo.get_variant_state_handle(x) for x in variants]
+        )
+
+    def test_threaded(self):
+        """Test that querying repositories in threads gives the same results
+        as querying them serially."""
+        from rez.resolver import _get_variant_states
+
+        names = ["foo", "bah", "eek", "missing"]
+        variants = [
+            variant.resource
+            for name in ("foo", "bah", "eek")
+            for package in iter_packages(name, paths=self.repo_paths)
+            for variant in package.iter_variants()
+        ]
+        self.assertEqual(len(set(x._repository.uid for x in variants)), 2)
+
+        release_times = get_last_release_times(names, self.repo_paths)
+        states = _get_variant_states(variants)
+
+        self.update_settings({"resolve_caching_threads": 4})
+        self.assertEqual(get_last_release_times(names, self.repo_paths),
+                         release_times)
+        self.assertEqual(_get_variant_states(variants), states)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,197 @@
+# Copyright Contributors to the Rez project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+test resolve caching
+"""
+import os
+import pickle
+import time
+import unittest
+
+from rez.resolver import Resolver, ResolverStatus
+from rez.package_repository import package_repository_manager
+from rez.tests.util import TestBase, TempdirMixin
+from rez.utils import memcached
+from rez.vendor.version.requirement import Requirement
+
+
+class _FakeMemcacheClient(object):
+    """Dict-backed stand-in for the memcache client."""
+    store = {}
+    ops = []
+
+    def __init__(self, servers, **kwargs):
+        pass
+
+    def set(self, key, val, time=0, min_compress_len=0):
+        self.ops.append("set")
+        self.store[key] = pickle.dumps(val)
+
+    def get(self, key):
+        self.ops.append("get")
+        value = self.store.get(key)
+        return None if value is None else pickle.loads(value)
+
+    def get_multi(self, keys, key_prefix=''):
+        self.ops.append("get_multi")
+        return dict(
+            (key, pickle.loads(self.store[key]))
+            for key in keys if key in self.store
+        )
+
+    def delete(self, key, time=None):
+        self.ops.append("delete")
+        self.store.pop(key, None)
+        return 1
+
+    def delete_multi(self, keys, time=None, key_prefix=''):
+        self.ops.append("delete_multi")
+        for key in keys:
+            self.store.pop(key, None)
+        return 1
+
+    def disconnect_all(self):
+        pass
+
+
+class TestResolveCaching(TestBase, TempdirMixin):
+    @classmethod
+    def setUpClass(cls):
+        TempdirMixin.setUpClass()
+
+        cls.settings = dict(
+            memcached_uri=["fake:11211"],
+            resolve_caching=True,
+            cache_package_files=False,
+            cache_listdir=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        TempdirMixin.tearDownClass()
+
+    def setUp(self):
+        super(TestResolveCaching, self).setUp()
+
+        self._client_class = memcached.Client_
+        memcached.Client_ = _FakeMemcacheClient
+        _FakeMemcacheClient.store.clear()
+
+        # every package is released, and every file written, at `self.t`
+        self.now = int(time.time())
+        self.t = self.now - 1000
+        self.repo_path = os.path.join(self.root, self.id().split('.')[-1])
+
+        self._create_package("python", "2.6.0")
+        self._create_package("python", "2.7.0")
+        self._create_package("pyfoo", "3.1.0", ["python-2"])
+
+        for root, dirs, files in os.walk(self.repo_path):
+            for name in dirs + files:
+                self._touch(os.path.join(root, name), self.t)
+
+    def tearDown(self):
+        memcached.Client_ = self._client_class
+        super(TestResolveCaching, self).tearDown()
+
+    def _create_package(self, name, version, requires=None):
+        path = os.path.join(self.repo_path, name, version)
+        os.makedirs(path)
+
+        with open(os.path.join(path, "package.py"), 'w') as f:
+            f.write("name = %r\nversion = %r\nrequires = %r\ntimestamp = %d\n"
+                    % (name, version, requires or [], self.now - 1000))
+
+    def _touch(self, path, time_):
+        os.utime(path, (time_, time_))
+
+    def _resolve(self, request, timestamp=None):
+        """Resolve, returning the resolver and the memcache ops performed."""
+        package_repository_manager.clear_caches()
+        del _FakeMemcacheClient.ops[:]
+
+        resolver = Resolver(
+            context=None,
+            package_requests=[Requirement(x) for x in request],
+            package_paths=[self.repo_path],
+            timestamp=timestamp)
+
+        resolver.solve()
+        self.assertEqual(resolver.status, ResolverStatus.solved)
+        return resolver, list(_FakeMemcacheClient.ops)
+
+    def _assert_resolve(self, request, from_cache, ops, timestamp=None):
+        resolver, ops_ = self._resolve(request, timestamp=timestamp)
+        self.assertEqual(resolver.from_cache, from_cache)
+        self.assertEqual(ops_, ops)
+
+        names = [x.qualified_package_name for x in resolver.resolved_packages]
+        self.assertEqual(names, ["python-2.7.0", "pyfoo-3.1.0"])
+
+    def test_hit(self):
+        """Test that a cached resolve is reused."""
+        self._assert_resolve(["pyfoo"], False, ["get_multi", "set"])
+        self._assert_resolve(["pyfoo"], True, ["get_multi"])
+        self.assertEqual(len(_FakeMemcacheClient.store), 1)
+
+    def test_modified_variant(self):
+        """Test that a modified package invalidates a cached resolve."""
+        self._assert_resolve(["pyfoo"], False, ["get_multi", "set"])
+
+        filepath = os.path.join(self.repo_path, "pyfoo", "3.1.0", "package.py")
+        self._touch(filepath, self.t + 500)
+
+        self._assert_resolve(["pyfoo"], False,
+                             ["get_multi", "delete_multi", "set"])
+        self._assert_resolve(["pyfoo"], True, ["get_multi"])
+        self.assertEqual(len(_FakeMemcacheClient.store), 1)
+
+    def test_release_since_solve(self):
+        """Test that a newer release invalidates a cached resolve."""
+        self._assert_resolve(["pyfoo"], False, ["get_multi", "set"])
+
+        self._touch(os.path.join(self.repo_path, "python"), self.t + 500)
+
+        self._assert_resolve(["pyfoo"], False,
+                             ["get_multi", "delete_multi", "set"])
+        self._assert_resolve(["pyfoo"], True, ["get_multi"])
+
+    def test_timestamped(self):
+        """Test resolves with a timestamp earlier than a release in the
+        cached resolve."""
+        release_time = self.t + 500
+        self._touch(os.path.join(self.repo_path, "python"), release_time)
+
+        # stores a non-timestamped entry
+        self._assert_resolve(["pyfoo"], False, ["get_multi", "set"])
+        self.assertEqual(len(_FakeMemcacheClient.store), 1)
+
+        # the non-timestamped entry is valid but too new, so it falls through
+        # to the (missing) timestamped entry, then stores that
+        self._assert_resolve(["pyfoo"], False, ["get_multi", "set"],
+                             timestamp=release_time - 100)
+        self.assertEqual(len(_FakeMemcacheClient.store), 2)
+
+        self._assert_resolve(["pyfoo"], True, ["get_multi"],
+                             timestamp=release_time - 100)
+
+        # a timestamp later than all releases uses the non-timestamped entry
+        self._assert_resolve(["pyfoo"], True, ["get_multi"],
+                             timestamp=self.now)
+        self.assertEqual(len(_FakeMemcacheClient.store), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,11 +14,13 @@
 
 
 """
-unit tests for 'utils.filesystem' module
+unit tests for 'utils.filesystem' and 'utils.execution' modules
 """
 import os
+import threading
 from rez.tests.util import TestBase
 from rez.utils import filesystem
+from rez.utils.execution import thread_map
 from rez.utils.platform_ import Platform, platform_
 
 
@@ -59,3 +61,25 @@ class TestCanonicalPath(TestBase):
         path = filesystem.canonical_path('/a/b/File.txt', platform)
         expects = '/a/b/file.txt'.replace('\\', os.sep)
         self.assertEqual(path, expects)
+
+
+class TestThreadMap(TestBase):
+    def test_serial(self):
+        """Test that a single worker runs in the calling thread."""
+        caller = threading.current_thread()
+        results = thread_map(lambda x: (x * 2, threading.current_thread()),
+                             range(5))
+
+        self.assertEqual([x[0] for x in results], [0, 2, 4, 6, 8])
+        self.assertTrue(all(x[1] is caller for x in results))
+
+    def test_threaded(self):
+        """Test that results are returned in item order when using threads."""
+        caller = threading.current_thread()
+        items = list(range(50))
+        results = thread_map(lambda x: (x * 2, threading.current_thread()),
+                             items, max_workers=4)
+
+        self.assertEqual([x[0] for x in results], [x * 2 for x in items])
+        self.assertTrue(all(x[1] is not caller for x in results))
+        self.assertEqual(thread_map(str, [], max_workers=4), [])
@@ -18,36 +18,189 @@ Functions that wrap readelf/patchelf utils on linux.
 """
 import os
 import pipes
+import re
+import struct
 import subprocess
+from multiprocessing import cpu_count
 
+from rez.backport.lru_cache import lru_cache
+from rez.utils.execution import Popen, thread_map
 from rez.utils.filesystem import make_path_writable
+from rez.utils.which import which
+
+
+# matches eg '0x000000000000000f (RPATH) Library rpath: [/xxx:/yyy]'
+_rpath_regex = re.compile(r"\((?:RPATH|RUNPATH)\)[^\[\n]*\[([^\]\n]*)\]")
+
+# see elf(5)
+_ELF_MAGIC = b"\x7fELF"
+_SHT_DYNAMIC = 6
+_DT_NULL = 0
+_DT_RPATH = 15
+_DT_RUNPATH = 29
+
+# (elf header, section header, dynamic entry) struct formats, keyed by
+# EI_CLASS. The elf header format excludes the 16 byte e_ident field.
+_struct_formats = {
+    1: ("HHIIIIIHHHHHH", "IIIIIIIIII", "iI"),  # ELFCLASS32
+    2: ("HHIQQQIHHHHHH", "IIQQQQIIQQ", "qQ")   # ELFCLASS64
+}
+
+
+# {(st_dev, st_ino, st_mtime, st_size): rpaths}
+_rpaths_cache = {}
+_rpaths_cache_max_size = 4096
 
 
 def get_rpaths(elfpath):
     """Get rpaths/runpaths from header.
+
+    Results are cached until the file changes. At most
+    `_rpaths_cache_max_size` results are kept, the oldest being evicted first.
     """
+    key = _file_cache_key(elfpath)
+    rpaths = _rpaths_cache.get(key)
 
-    # stdout lines look like:
-    # 0x000000000000000f (RPATH) Library rpath: [/xxx:/yyy]
-    #
+    if rpaths is None:
+        rpaths = tuple(_get_rpaths(elfpath))
+        if key is not None:
+            while len(_rpaths_cache) >= _rpaths_cache_max_size:
+                try:
+                    _rpaths_cache.pop(next(iter(_rpaths_cache)), None)
+                except (StopIteration, RuntimeError):
+                    break  # emptied or changed by another thread
+            _rpaths_cache[key] = rpaths
+
+    return list(rpaths)
+
+
+def _get_rpaths(elfpath):
+    rpaths = _read_rpaths(elfpath)
+    if rpaths is not None:
+        return rpaths
+
+    # fall back to readelf for files we can't parse ourselves
     out = _run("readelf", "-d", elfpath)
 
     # parse out rpath/runpath
-    for line in out.split('\n'):
-        parts = line.strip().split()
-        if "(RPATH)" in parts or "(RUNPATH)" in parts:
-            txt = parts[-1]
-            txt = txt[1:-1]  # strip [ and ]
-            rpaths = txt.split(':')
-
-            return rpaths or []
+    m = _rpath_regex.search(out)
+    if m:
+        return m.group(1).split(':')
 
     return []
 
 
+def _file_cache_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    return (st.st_dev, st.st_ino, st.st_mtime, st.st_size)
+
+
+def _read_rpaths(elfpath):
+    """Read rpaths/runpaths directly from the elf's dynamic section.
+
+    This avoids running readelf, which is comparatively slow when done for
+    many files.
+
+    Returns:
+        List of str: The rpaths, or None if the file could not be parsed.
+
+    Raises:
+        RuntimeError: If the file is not an elf, or its header is truncated.
+    """
+    try:
+        with open(elfpath, "rb") as f:
+            ident = f.read(16)
+            if ident[:4] != _ELF_MAGIC:
+                raise RuntimeError("Not an ELF file: %s" % elfpath)
+            if len(ident) < 16:
+                raise RuntimeError("Failed to read file header: %s" % elfpath)
+
+            formats = _struct_formats.get(ord(ident[4:5]))
+            byte_order = {1: '<', 2: '>'}.get(ord(ident[5:6]))
+            if not formats or not byte_order:
+                return None
+
+            ehdr_fmt, shdr_fmt, dyn_fmt = (byte_order + x for x in formats)
+            ehdr = _read_struct(f, ehdr_fmt)
+            shoff, shentsize, shnum = ehdr[5], ehdr[10], ehdr[11]
+
+            if not shoff or not shnum:
+                return None  # no section headers, or too many to list here
+
+            sections = []
+            for i in range(shnum):
+                f.seek(shoff + i * shentsize)
+                sections.append(_read_struct(f, shdr_fmt))
+
+            # (sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size,
+            #  sh_link, ...)
+            dynamic = [x for x in sections if x[1] == _SHT_DYNAMIC]
+            if not dynamic:
+                return []  # eg statically linked
+
+            _, _, _, _, offset, size, link = dynamic[0][:7]
+            strtab_offset = sections[link][4]
+
+            f.seek(offset)
+            data = f.read(size)
+            entsize = struct.calcsize(dyn_fmt)
+
+            for i in range(0, len(data) - entsize + 1, entsize):
+                tag, value = struct.unpack_from(dyn_fmt, data, i)
+                if tag == _DT_NULL:
+                    break
+
+                if tag in (_DT_RPATH, _DT_RUNPATH):
+                    f.seek(strtab_offset + value)
+                    txt = _read_cstring(f).decode("utf-8", "replace")
+                    return txt.split(':')
+
+            return []
+
+    except (IOError, OSError, IndexError, struct.error):
+        return None
+
+
+def _read_struct(f, fmt):
+    size = struct.calcsize(fmt)
+    data = f.read(size)
+    if len(data) != size:
+        raise struct.error("unexpected end of file")
+    return struct.unpack(fmt, data)
+
+
+def _read_cstring(f):
+    chunks = []
+    while True:
+        chunk = f.read(256)
+        if not chunk:
+            break
+
+        i = chunk.find(b"\0")
+        if i != -1:
+            chunks.append(chunk[:i])
+            break
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
 def patch_rpaths(elfpath, rpaths):
     """Replace an elf's rpath header with those provided.
+
+    Nothing is done if the elf already has the given rpaths.
     """
+    key = _file_cache_key(elfpath)
+
+    try:
+        if get_rpaths(elfpath) == list(rpaths):
+            return
+    except RuntimeError:
+        pass  # let patchelf report the problem
 
     # this is a hack to get around https://github.com/nerdvegas/rez/issues/1074
     # I actually hit a case where patchelf was installed as a rez suite tool,
@@ -57,20 +210,67 @@ def patch_rpaths(elfpath, rpaths):
     env = os.environ.copy()
     env["ORIGIN"] = "$ORIGIN"
 
-    with make_path_writable(elfpath):
-        if rpaths:
-            _run("patchelf", "--set-rpath", ':'.join(rpaths), elfpath, env=env)
-        else:
-            _run("patchelf", "--remove-rpath")
+    try:
+        with make_path_writable(elfpath):
+            if rpaths:
+                _run("patchelf", "--set-rpath", ':'.join(rpaths), elfpath,
+                     env=env)
+            else:
+                _run("patchelf", "--remove-rpath", elfpath, env=env)
+    finally:
+        _rpaths_cache.pop(key, None)
+
+
+def patch_rpaths_many(items, max_workers=None):
+    """Replace the rpath headers of several elfs.
+
+    Each elf is patched independently, so several patchelf processes are run
+    at once.
+
+    Args:
+        items (list of 2-tuple): (elfpath, rpaths) for each elf to patch.
+        max_workers (int): Maximum number of concurrent patchelf processes.
+            Defaults to the cpu count.
+
+    Returns:
+        list: The `RuntimeError` raised when patching each elf, or None if it
+        was patched successfully. In the same order as `items`.
+    """
+    def _patch(item):
+        try:
+            patch_rpaths(*item)
+        except RuntimeError as e:
+            return e
+        return None
+
+    if max_workers is None:
+        max_workers = cpu_count()
+
+    return thread_map(_patch, items, max_workers)
+
+
+@lru_cache()
+def _find_program(name):
+    """Look up a utility on $PATH once, rather than on every call.
+    """
+    return which(name) or name
 
 
 def _run(*nargs, **popen_kwargs):
-    proc = subprocess.Popen(
-        nargs,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        **popen_kwargs
-    )
+    args = (_find_program(nargs[0]),) + nargs[1:]
+
+    try:
+        proc = Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            **popen_kwargs
+        )
+    except OSError as e:
+        # eg readelf fallback on a host without binutils
+        cmd_ = ' '.join(pipes.quote(x) for x in nargs)
+        raise RuntimeError("Command %s - failed: %s" % (cmd_, e))
 
     out, err = proc.communicate()
 
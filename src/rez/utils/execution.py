@@ -41,6 +41,31 @@ def add_sys_paths(paths):
         sys.path = original_syspath
 
 
+def thread_map(func, items, max_workers=1):
+    """Call `func` on each item, using up to `max_workers` threads.
+
+    This is intended for I/O-bound work. With a single worker (or a single
+    item), everything runs in the calling thread.
+
+    Returns:
+        list: Results, in the same order as `items`.
+    """
+    items = list(items)
+    workers = min(max_workers, len(items))
+
+    if workers < 2:
+        return [func(x) for x in items]
+
+    from multiprocessing.pool import ThreadPool
+
+    pool = ThreadPool(workers)
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
 if six.PY2:
     class _PopenBase(subprocess.Popen):
         def __enter__(self):
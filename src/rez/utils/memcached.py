@@ -80,7 +80,8 @@ class Client(object):
             `memcache.Client` instance.
         """
         if self._client is None:
-            self._client = Client_(self.servers)
+            # protocol 2 is the most compact that python 2 and 3 can both read
+            self._client = Client_(self.servers, pickleProtocol=2)
         return self._client
 
     def test_servers(self):
@@ -137,6 +138,41 @@ class Client(object):
         self.logger("MISS: %s", key)
         return self.miss
 
+    def get_multi(self, keys):
+        """See memcache.Client.
+
+        Retrieves several entries in a single request.
+
+        Returns:
+            dict: Cached values, keyed by the keys given. Keys that were not
+            cached are not present in the dict.
+        """
+        if not self.servers:
+            return {}
+
+        qualified_keys = {}
+        for key in keys:
+            qualified_key = self._qualified_key(key)
+            hashed_key = self.key_hasher(qualified_key)
+            qualified_keys[hashed_key] = (key, qualified_key)
+
+        entries = self.client.get_multi(list(qualified_keys.keys()))
+        results = {}
+
+        for hashed_key, (key, qualified_key) in qualified_keys.items():
+            entry = entries.get(hashed_key)
+
+            if isinstance(entry, tuple) and len(entry) == 2:
+                key_, result = entry
+                if key_ == qualified_key:
+                    self.logger("HIT: %s", qualified_key)
+                    results[key] = result
+                    continue
+
+            self.logger("MISS: %s", qualified_key)
+
+        return results
+
     def delete(self, key):
         """See memcache.Client."""
         if self.servers:
@@ -144,6 +180,18 @@ class Client(object):
             hashed_key = self.key_hasher(key)
             self.client.delete(hashed_key)
 
+    def delete_multi(self, keys):
+        """See memcache.Client.
+
+        Deletes several entries in a single request.
+        """
+        if self.servers:
+            hashed_keys = [
+                self.key_hasher(self._qualified_key(key))
+                for key in keys
+            ]
+            self.client.delete_multi(hashed_keys)
+
     def flush(self, hard=False):
         """Drop existing entries from the cache.
 